@@ -1,15 +1,12 @@
 """케이스별 시나리오 비교 로직 (고도화 버전)"""
-from typing import List, Dict
-from dataclasses import dataclass
-
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import List, Dict, Optional
+from dataclasses import dataclass, field
 
 from models.asset import InheritanceInfo
 from calculator.inheritance_tax import calculate_inheritance_tax, TaxResult
 from calculator.deductions import (
     calculate_deductions,
+    calculate_asset_deductions,
     DeductionType,
     SPOUSE_MIN_DEDUCTION,
     SPOUSE_MAX_DEDUCTION,
@@ -20,6 +17,8 @@ from calculator.deductions import (
 @dataclass
 class CaseResult:
     """케이스별 계산 결과"""
+    __slots__ = ("case_name", "description", "tax_result", "spouse_inheritance", "deduction_type")
+
     case_name: str               # 케이스 이름
     description: str             # 케이스 설명
     tax_result: TaxResult        # 상속세 계산 결과
@@ -37,10 +36,17 @@ class ComparisonResult:
     cases: List[CaseResult]      # 모든 케이스 결과
     optimal_case: CaseResult     # 최적 케이스
     max_savings: int             # 최대 절세액 (최악 케이스 대비)
+    # 세액 낮은 순 정렬 (compare_cases가 최적 케이스를 고를 때 정렬한 목록을 넘김, 없으면 생성 시 정렬)
+    # cases에서 파생된 값이라 비교에서 제외. 기본값이 있는 필드라 이 클래스는 __slots__ 없이 둠
+    sorted_cases: Optional[List[CaseResult]] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.sorted_cases is None:
+            self.sorted_cases = sorted(self.cases, key=lambda x: x.final_tax)
 
     def get_sorted_cases(self) -> List[CaseResult]:
-        """세액 낮은 순으로 정렬"""
-        return sorted(self.cases, key=lambda x: x.final_tax)
+        """세액 낮은 순으로 정렬 (하위 호환, 이전처럼 새 리스트 반환)"""
+        return list(self.sorted_cases)
 
 
 def calculate_spouse_legal_share_amount(info: InheritanceInfo) -> int:
@@ -66,47 +72,28 @@ def generate_cases(info: InheritanceInfo) -> List[tuple]:
         # 배우자 법정상속분
         legal_share = calculate_spouse_legal_share_amount(info)
 
-        # 케이스 A: 배우자 법정상속분 + 일괄공제
-        cases.append((
-            "A: 법정상속분",
-            f"배우자 법정상속분 + 일괄공제 5억",
-            legal_share,
-            DeductionType.LUMP_SUM
-        ))
-
-        # 케이스 B: 배우자 공제 최대화 (30억 한도, 또는 과세가액 전체)
+        # 배우자 공제 최대화 (30억 한도, 또는 과세가액 전체)
         max_spouse = min(net_value, SPOUSE_MAX_DEDUCTION)
-        # 법정상속분과 다르거나 비교를 위해 항상 표시
-        cases.append((
-            "B: 배우자 최대",
-            f"배우자 상속 최대화 (30억 한도)",
-            max_spouse,
-            DeductionType.LUMP_SUM
-        ))
-
-        # 케이스 C: 배우자 공제 최소화 (5억)
+        # 배우자 공제 최소화 (5억)
         min_spouse = min(SPOUSE_MIN_DEDUCTION, net_value)
-        cases.append((
-            "C: 배우자 최소",
-            f"배우자 상속 최소화 (5억)",
-            min_spouse,
-            DeductionType.LUMP_SUM
-        ))
 
-        # 중복 케이스 제거 (배우자 상속액이 같은 경우)
-        seen_amounts = set()
-        unique_cases = []
-        for case in cases:
-            amount = case[2]  # 배우자상속액
-            if amount not in seen_amounts:
-                seen_amounts.add(amount)
-                unique_cases.append(case)
-        cases = unique_cases
-
-        # 케이스 재정렬 (이름 다시 부여)
-        for i, case in enumerate(cases):
-            case_letter = chr(ord('A') + i)
-            cases[i] = (f"{case_letter}: {case[0].split(': ')[1]}", case[1], case[2], case[3])
+        # (이름, 설명, 배우자상속액) - 배우자 상속액이 같은 케이스는 먼저 나온 것만 유지
+        spouse_cases = {}
+        for name, description, amount in (
+            ("법정상속분", "배우자 법정상속분 + 일괄공제 5억", legal_share),
+            ("배우자 최대", "배우자 상속 최대화 (30억 한도)", max_spouse),
+            ("배우자 최소", "배우자 상속 최소화 (5억)", min_spouse),
+        ):
+            spouse_cases.setdefault(amount, (name, description))
+
+        # 남은 케이스에 A, B, C 순서로 이름 부여
+        for i, (amount, (name, description)) in enumerate(spouse_cases.items()):
+            cases.append((
+                f"{chr(ord('A') + i)}: {name}",
+                description,
+                amount,
+                DeductionType.LUMP_SUM
+            ))
 
     else:
         # 배우자 없는 경우
@@ -147,21 +134,30 @@ def compare_cases(
     cases = generate_cases(info)
     results = []
 
+    # 과세가액, 재산 관련 공제는 모든 케이스에서 동일하므로 한 번만 계산해 넘김
+    net_inheritance = info.net_inheritance
+    asset_deductions = calculate_asset_deductions(info)
+
+    # 배우자 상속 비율 = 배우자상속액 / 과세가액 (과세가액 0이면 비율 0)
+    inv_net_inheritance = 1.0 / net_inheritance if net_inheritance > 0 else 0.0
+
     for case_name, description, spouse_amount, deduction_type in cases:
         # 공제액 계산
         deductions = calculate_deductions(
             info,
             deduction_type=deduction_type,
-            spouse_inheritance_amount=spouse_amount
+            spouse_inheritance_amount=spouse_amount,
+            asset_deductions=asset_deductions
         )
 
         # 상속세 계산
         tax_result = calculate_inheritance_tax(
             info,
             deduction_detail=deductions,
-            spouse_inheritance_ratio=spouse_amount / info.net_inheritance if info.net_inheritance > 0 else 0,
+            spouse_inheritance_ratio=spouse_amount * inv_net_inheritance,
             grandchild_amount=grandchild_amount,
-            grandchild_is_minor=grandchild_is_minor
+            grandchild_is_minor=grandchild_is_minor,
+            taxable_inheritance=net_inheritance
         )
 
         results.append(CaseResult(
@@ -172,16 +168,17 @@ def compare_cases(
             deduction_type=deduction_type
         ))
 
-    # 최적 케이스 찾기 (세액이 가장 낮은 것)
-    optimal = min(results, key=lambda x: x.final_tax)
+    # 세액 순으로 한 번 정렬해 최적(최저)/최악(최고) 케이스를 양 끝에서 가져옴
+    # (안정 정렬이므로 세액이 같으면 먼저 생성된 케이스가 최적)
+    sorted_results = sorted(results, key=lambda x: x.final_tax)
+    optimal = sorted_results[0]
 
     # 최대 절세액 (최악 케이스 대비)
-    max_tax = max(r.final_tax for r in results)
-    min_tax = min(r.final_tax for r in results)
-    max_savings = max_tax - min_tax
+    max_savings = sorted_results[-1].final_tax - optimal.final_tax
 
     return ComparisonResult(
         cases=results,
         optimal_case=optimal,
-        max_savings=max_savings
+        max_savings=max_savings,
+        sorted_cases=sorted_results
     )
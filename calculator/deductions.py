@@ -1,12 +1,8 @@
 """상속세 공제 항목 계산 (고도화 버전)"""
-from typing import Dict
+from typing import Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from models.asset import InheritanceInfo
 
 
@@ -22,6 +18,10 @@ LUMP_SUM_DEDUCTION = 500_000_000        # 일괄공제: 5억원
 SPOUSE_MIN_DEDUCTION = 500_000_000      # 배우자공제 최소: 5억원
 SPOUSE_MAX_DEDUCTION = 3_000_000_000    # 배우자공제 최대: 30억원
 
+# 배우자 법정상속분 비율 (자녀 수 → 비율, 배우자 1.5 : 자녀 각 1)
+# 자녀 0명이면 배우자 단독 상속(1.0), 표 범위를 넘으면 직접 계산
+SPOUSE_LEGAL_SHARE_BY_CHILDREN = (1.0,) + tuple(1.5 / (1.5 + n) for n in range(1, 21))
+
 # 인적 공제
 CHILD_DEDUCTION = 50_000_000            # 자녀공제: 1인당 5천만원
 MINOR_DEDUCTION_PER_YEAR = 10_000_000   # 미성년자공제: 연 1천만원
@@ -33,6 +33,7 @@ FINANCIAL_FULL_THRESHOLD = 20_000_000   # 전액 공제 기준: 2천만원 미
 FINANCIAL_FIXED_THRESHOLD = 100_000_000  # 고정 공제 기준: 1억
 FINANCIAL_FIXED_DEDUCTION = 20_000_000   # 고정 공제액: 2천만원
 FINANCIAL_RATE = 0.20                    # 비율 공제: 20%
+FINANCIAL_RATE_PERCENT = round(FINANCIAL_RATE * 100)  # 정수 연산용
 FINANCIAL_MAX_DEDUCTION = 200_000_000    # 최대 공제: 2억원
 
 # 동거주택 공제
@@ -49,11 +50,41 @@ class DeductionType(Enum):
 @dataclass
 class DeductionResult:
     """공제 계산 결과"""
+    __slots__ = ("details", "total", "deduction_type")
+
     details: Dict[str, int]         # 공제 항목별 금액
     total: int                      # 총 공제액
     deduction_type: DeductionType   # 적용된 공제 유형
 
 
+@dataclass
+class PersonalDeductionAmounts:
+    """인적 공제 항목별 금액 (합계만 필요할 때 딕셔너리 생성 생략)"""
+    __slots__ = ("child", "minor", "elderly", "disabled")
+
+    child: int       # 자녀공제
+    minor: int       # 미성년자공제
+    elderly: int     # 연로자공제
+    disabled: int    # 장애인공제
+
+    @property
+    def total(self) -> int:
+        return self.child + self.minor + self.elderly + self.disabled
+
+    def to_dict(self) -> Dict[str, int]:
+        """화면 표시용 항목명 딕셔너리 (0원 항목 제외)"""
+        deductions = {}
+        if self.child > 0:
+            deductions["자녀공제"] = self.child
+        if self.minor > 0:
+            deductions["미성년자공제"] = self.minor
+        if self.elderly > 0:
+            deductions["연로자공제"] = self.elderly
+        if self.disabled > 0:
+            deductions["장애인공제"] = self.disabled
+        return deductions
+
+
 # ============================================
 # 인적 공제 계산
 # ============================================
@@ -109,7 +140,7 @@ def calculate_disabled_deduction(info: InheritanceInfo) -> int:
     return total
 
 
-def calculate_personal_deductions(info: InheritanceInfo) -> Dict[str, int]:
+def calculate_personal_deduction_amounts(info: InheritanceInfo) -> PersonalDeductionAmounts:
     """
     모든 인적 공제 계산
 
@@ -118,25 +149,37 @@ def calculate_personal_deductions(info: InheritanceInfo) -> Dict[str, int]:
     - 장애인: 모든 공제와 중복 O
     - 배우자: 자녀/미성년자/연로자 공제와 중복 X
     """
-    deductions = {}
-
-    child_ded = calculate_child_deduction(info)
-    if child_ded > 0:
-        deductions["자녀공제"] = child_ded
-
-    minor_ded = calculate_minor_deduction(info)
-    if minor_ded > 0:
-        deductions["미성년자공제"] = minor_ded
+    heir = info.heir
+
+    # 자녀 목록을 한 번만 순회하며 미성년/연로/장애 항목을 함께 집계
+    # (개별 calculate_*_deduction 함수와 같은 결과)
+    minor_years = 0
+    num_elderly = heir.num_elderly_parents
+    disabled_years = 0
+    for child in heir.children:
+        age = child.age
+        if age < 19:
+            minor_years += 19 - age
+        elif age >= 65:
+            num_elderly += 1
+        if child.is_disabled:
+            disabled_years += child.life_expectancy
 
-    elderly_ded = calculate_elderly_deduction(info)
-    if elderly_ded > 0:
-        deductions["연로자공제"] = elderly_ded
+    # 배우자 장애인
+    if heir.spouse.exists and heir.spouse.is_disabled:
+        disabled_years += heir.spouse.life_expectancy
+
+    return PersonalDeductionAmounts(
+        child=calculate_child_deduction(info),
+        minor=minor_years * MINOR_DEDUCTION_PER_YEAR,
+        elderly=num_elderly * ELDERLY_DEDUCTION,
+        disabled=disabled_years * DISABLED_DEDUCTION_PER_YEAR,
+    )
 
-    disabled_ded = calculate_disabled_deduction(info)
-    if disabled_ded > 0:
-        deductions["장애인공제"] = disabled_ded
 
-    return deductions
+def calculate_personal_deductions(info: InheritanceInfo) -> Dict[str, int]:
+    """모든 인적 공제 계산 (항목명 → 금액, 0원 항목 제외)"""
+    return calculate_personal_deduction_amounts(info).to_dict()
 
 
 # ============================================
@@ -148,10 +191,10 @@ def calculate_spouse_legal_share(info: InheritanceInfo) -> float:
     if not info.heir.has_spouse:
         return 0.0
 
-    # 법정상속분: 배우자 1.5 : 자녀 각 1
+    # 법정상속분: 배우자 1.5 : 자녀 각 1 (자녀 0명이면 배우자만 있는 경우 1.0)
     num_children = info.heir.num_children
-    if num_children == 0:
-        return 1.0  # 배우자만 있는 경우
+    if num_children < len(SPOUSE_LEGAL_SHARE_BY_CHILDREN):
+        return SPOUSE_LEGAL_SHARE_BY_CHILDREN[num_children]
 
     total_weight = 1.5 + num_children
     return 1.5 / total_weight
@@ -215,16 +258,14 @@ def calculate_financial_deduction(info: InheritanceInfo) -> int:
     """
     net_financial = info.asset.net_financial
 
-    if net_financial < FINANCIAL_FULL_THRESHOLD:
-        # 2천만원 미만: 전액 공제
-        return net_financial
-    elif net_financial <= FINANCIAL_FIXED_THRESHOLD:
-        # 2천만원 ~ 1억: 2천만원 고정
-        return FINANCIAL_FIXED_DEDUCTION
-    else:
-        # 1억 초과: 20%, 최대 2억
-        deduction = int(net_financial * FINANCIAL_RATE)
-        return min(deduction, FINANCIAL_MAX_DEDUCTION)
+    # 구간 분기 대신 min/max 한 식으로 계산:
+    # - min(순금융재산, 2천만원): 2천만원 미만은 전액, 이상은 2천만원
+    # - 20%는 1억 이하에서 2천만원을 넘지 않으므로 1억 초과 구간에서만 선택됨
+    # - 최대 2억 한도
+    return min(
+        max(min(net_financial, FINANCIAL_FIXED_DEDUCTION), net_financial * FINANCIAL_RATE_PERCENT // 100),
+        FINANCIAL_MAX_DEDUCTION
+    )
 
 
 # ============================================
@@ -278,12 +319,19 @@ def calculate_itemized_deductions(info: InheritanceInfo) -> Dict[str, int]:
     return deductions
 
 
-def get_optimal_base_deduction_type(info: InheritanceInfo) -> DeductionType:
+def get_optimal_base_deduction_type(
+    info: InheritanceInfo,
+    itemized: Optional[Dict[str, int]] = None
+) -> DeductionType:
     """
     일괄공제 vs 항목별공제 중 유리한 것 선택
+    itemized: 미리 계산한 항목별 공제 (없으면 계산)
     """
-    itemized = calculate_itemized_deductions(info)
-    itemized_total = sum(itemized.values())
+    if itemized is None:
+        # 판정에는 합계만 필요하므로 항목 딕셔너리를 만들지 않음
+        itemized_total = BASIC_DEDUCTION + calculate_personal_deduction_amounts(info).total
+    else:
+        itemized_total = sum(itemized.values())
 
     if itemized_total > LUMP_SUM_DEDUCTION:
         return DeductionType.ITEMIZED
@@ -295,10 +343,30 @@ def get_optimal_base_deduction_type(info: InheritanceInfo) -> DeductionType:
 # 전체 공제 계산
 # ============================================
 
+def calculate_asset_deductions(info: InheritanceInfo) -> Dict[str, int]:
+    """
+    재산 관련 공제 (금융재산공제, 동거주택공제)
+    공제 유형/배우자 상속액과 무관하므로 케이스 비교 시 한 번만 계산
+    """
+    deductions = {}
+
+    financial_ded = calculate_financial_deduction(info)
+    if financial_ded > 0:
+        deductions["금융재산공제"] = financial_ded
+
+    co_res_ded = calculate_co_residence_deduction(info)
+    if co_res_ded > 0:
+        deductions["동거주택공제"] = co_res_ded
+
+    return deductions
+
+
 def calculate_deductions(
     info: InheritanceInfo,
     deduction_type: DeductionType = DeductionType.LUMP_SUM,
-    spouse_inheritance_amount: int = 0
+    spouse_inheritance_amount: int = 0,
+    asset_deductions: Optional[Dict[str, int]] = None,
+    itemized_deductions: Optional[Dict[str, int]] = None
 ) -> Dict[str, int]:
     """
     전체 공제액 계산
@@ -307,6 +375,8 @@ def calculate_deductions(
         info: 상속 정보
         deduction_type: 공제 유형 (일괄공제 vs 항목별공제)
         spouse_inheritance_amount: 배우자 실제 상속액
+        asset_deductions: 미리 계산한 재산 관련 공제 (없으면 계산)
+        itemized_deductions: 미리 계산한 항목별 공제 (없으면 계산, 항목별공제일 때만 사용)
 
     Returns:
         공제 항목별 금액 딕셔너리
@@ -317,8 +387,9 @@ def calculate_deductions(
     if deduction_type == DeductionType.LUMP_SUM:
         deductions["일괄공제"] = LUMP_SUM_DEDUCTION
     else:
-        itemized = calculate_itemized_deductions(info)
-        deductions.update(itemized)
+        if itemized_deductions is None:
+            itemized_deductions = calculate_itemized_deductions(info)
+        deductions.update(itemized_deductions)
 
     # 2. 배우자공제 (일괄공제와 별도)
     if info.heir.has_spouse and spouse_inheritance_amount > 0:
@@ -326,15 +397,10 @@ def calculate_deductions(
         if spouse_ded > 0:
             deductions["배우자공제"] = spouse_ded
 
-    # 3. 금융재산공제
-    financial_ded = calculate_financial_deduction(info)
-    if financial_ded > 0:
-        deductions["금융재산공제"] = financial_ded
-
-    # 4. 동거주택공제
-    co_res_ded = calculate_co_residence_deduction(info)
-    if co_res_ded > 0:
-        deductions["동거주택공제"] = co_res_ded
+    # 3. 금융재산공제, 4. 동거주택공제
+    if asset_deductions is None:
+        asset_deductions = calculate_asset_deductions(info)
+    deductions.update(asset_deductions)
 
     return deductions
 
@@ -346,8 +412,12 @@ def calculate_all_deductions_with_comparison(
     """
     최적의 공제 유형을 자동 선택하여 계산
     """
-    optimal_type = get_optimal_base_deduction_type(info)
-    details = calculate_deductions(info, optimal_type, spouse_inheritance_amount)
+    # 유형 판정에 쓴 항목별 공제를 그대로 재사용 (인적공제 재계산 방지)
+    itemized = calculate_itemized_deductions(info)
+    optimal_type = get_optimal_base_deduction_type(info, itemized)
+    details = calculate_deductions(
+        info, optimal_type, spouse_inheritance_amount, itemized_deductions=itemized
+    )
     total = sum(details.values())
 
     return DeductionResult(
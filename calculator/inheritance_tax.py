@@ -1,10 +1,7 @@
 """상속세 계산 핵심 로직 (고도화 버전)"""
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
-
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import bisect
 
 from models.asset import InheritanceInfo
 
@@ -13,14 +10,21 @@ from models.asset import InheritanceInfo
 # 상속세율 구간
 # ============================================
 
-# (과세표준 상한, 세율, 누진공제액)
-TAX_BRACKETS = [
+# (과세표준 상한, 세율, 누진공제액) - 아래 조회용 튜플을 import 시 한 번 만들므로 변경 불가 튜플로 고정
+TAX_BRACKETS = (
     (100_000_000, 0.10, 0),              # 1억 이하: 10%
     (500_000_000, 0.20, 10_000_000),     # 5억 이하: 20%, 누진공제 1천만원
     (1_000_000_000, 0.30, 60_000_000),   # 10억 이하: 30%, 누진공제 6천만원
     (3_000_000_000, 0.40, 160_000_000),  # 30억 이하: 40%, 누진공제 1억6천만원
     (float('inf'), 0.50, 460_000_000),   # 30억 초과: 50%, 누진공제 4억6천만원
-]
+)
+
+# 세율 구간 상한 (bisect 조회용, 마지막 구간은 inf)
+TAX_BRACKET_CEILINGS = tuple(bracket for bracket, _, _ in TAX_BRACKETS)
+# 구간별 세율(%) / 누진공제액 (같은 인덱스로 조회, 구간 튜플 언패킹 생략)
+# 세율을 정수 %로 두어 산출세액을 float 곱셈 없이 정수 연산으로 계산
+TAX_BRACKET_RATE_PERCENTS = tuple(round(rate * 100) for _, rate, _ in TAX_BRACKETS)
+TAX_BRACKET_PROGRESSIVE_DEDUCTIONS = tuple(deduction for _, _, deduction in TAX_BRACKETS)
 
 # 세대생략 할증률
 GENERATION_SKIP_SURCHARGE_RATE = 0.30          # 기본 30%
@@ -29,12 +33,27 @@ GENERATION_SKIP_MINOR_THRESHOLD = 2_000_000_000  # 20억원
 
 # 신고세액공제율
 FILING_TAX_CREDIT_RATE = 0.03  # 3%
+FILING_TAX_CREDIT_PERCENT = round(FILING_TAX_CREDIT_RATE * 100)  # 정수 연산용
 
 
 # ============================================
 # 세액 계산 함수
 # ============================================
 
+def find_tax_bracket(taxable_amount: int) -> Tuple[float, float, int]:
+    """
+    과세표준이 속하는 세율 구간 조회
+
+    Args:
+        taxable_amount: 과세표준
+
+    Returns:
+        (과세표준 상한, 세율, 누진공제액)
+    """
+    # 과세표준 이상인 첫 구간 상한 (최고 구간 상한이 inf이므로 항상 존재)
+    return TAX_BRACKETS[bisect.bisect_left(TAX_BRACKET_CEILINGS, taxable_amount)]
+
+
 def calculate_tax_amount(taxable_amount: int) -> int:
     """
     과세표준에 따른 상속세 산출세액 계산
@@ -48,13 +67,8 @@ def calculate_tax_amount(taxable_amount: int) -> int:
     if taxable_amount <= 0:
         return 0
 
-    for bracket, rate, deduction in TAX_BRACKETS:
-        if taxable_amount <= bracket:
-            return int(taxable_amount * rate - deduction)
-
-    # 최고 구간
-    _, rate, deduction = TAX_BRACKETS[-1]
-    return int(taxable_amount * rate - deduction)
+    i = bisect.bisect_left(TAX_BRACKET_CEILINGS, taxable_amount)
+    return int(taxable_amount * TAX_BRACKET_RATE_PERCENTS[i] // 100 - TAX_BRACKET_PROGRESSIVE_DEDUCTIONS[i])
 
 
 def calculate_generation_skip_surcharge(
@@ -99,25 +113,19 @@ def calculate_generation_skip_surcharge(
 
     if skip_amount == 0:
         # children에서 손자녀 정보로 계산 (기존 방식 fallback)
-        for child in info.heir.children:
-            if child.is_grandchild and child.parent_alive:
-                # 손자녀 1인당 균등 배분 가정
-                num_heirs = info.heir.total_heirs
-                if num_heirs > 0:
-                    skip_amount = taxable_inheritance // num_heirs
+        # 손자녀 1인당 균등 배분 가정 - 해당 손자녀가 한 명이라도 있으면 같은 값
+        if info.heir.has_surcharged_grandchild:
+            num_heirs = info.heir.total_heirs
+            if num_heirs > 0:
+                skip_amount = taxable_inheritance // num_heirs
 
     if skip_amount == 0:
         return 0
 
     # 할증률 결정
     # 미성년자 + 20억 초과 -> 40%, 그 외 -> 30%
-    is_minor = grandchild_is_minor
-    if not is_minor:
-        # children에서 확인
-        for child in info.heir.children:
-            if child.is_grandchild and child.is_minor:
-                is_minor = True
-                break
+    # children에서 확인 (명시적으로 미성년자로 전달되면 생략)
+    is_minor = grandchild_is_minor or info.heir.has_minor_grandchild
 
     if is_minor and skip_amount > GENERATION_SKIP_MINOR_THRESHOLD:
         surcharge_rate = GENERATION_SKIP_SURCHARGE_RATE_MINOR  # 40%
@@ -145,7 +153,7 @@ def calculate_filing_credit(calculated_tax: int, file_on_time: bool) -> int:
         신고세액공제
     """
     if file_on_time:
-        return int(calculated_tax * FILING_TAX_CREDIT_RATE)
+        return calculated_tax * FILING_TAX_CREDIT_PERCENT // 100
     return 0
 
 
@@ -156,6 +164,12 @@ def calculate_filing_credit(calculated_tax: int, file_on_time: bool) -> int:
 @dataclass
 class TaxResult:
     """상속세 계산 결과"""
+    __slots__ = (
+        "total_inheritance", "taxable_inheritance", "total_deduction", "taxable_amount",
+        "calculated_tax", "generation_surcharge", "filing_credit", "prior_gift_tax_credit",
+        "final_tax", "deduction_detail",
+    )
+
     total_inheritance: int       # 총 상속재산
     taxable_inheritance: int     # 과세가액 (채무/장례비 차감 후)
     total_deduction: int         # 총 공제액
@@ -191,7 +205,8 @@ def calculate_inheritance_tax(
     deduction_detail: Dict[str, int],
     spouse_inheritance_ratio: float = 0.0,
     grandchild_amount: int = 0,
-    grandchild_is_minor: bool = False
+    grandchild_is_minor: bool = False,
+    taxable_inheritance: Optional[int] = None
 ) -> TaxResult:
     """
     상속세 계산
@@ -202,6 +217,7 @@ def calculate_inheritance_tax(
         spouse_inheritance_ratio: 배우자 상속 비율 (0.0 ~ 1.0)
         grandchild_amount: 세대생략 상속가액 (손자녀에게 상속할 금액)
         grandchild_is_minor: 손자녀가 미성년자인지 여부
+        taxable_inheritance: 미리 계산한 과세가액 (없으면 계산)
 
     Returns:
         TaxResult: 상속세 계산 결과
@@ -210,7 +226,8 @@ def calculate_inheritance_tax(
     total_inheritance = info.total_inheritance
 
     # 2. 과세가액 (채무, 장례비용 등 차감)
-    taxable_inheritance = info.net_inheritance
+    if taxable_inheritance is None:
+        taxable_inheritance = info.net_inheritance
 
     # 3. 총 공제액
     total_deduction = sum(deduction_detail.values())
@@ -220,6 +237,22 @@ def calculate_inheritance_tax(
     if taxable_amount < 0:
         taxable_amount = 0
 
+    # 과세표준 0원(과세가액 0원 또는 공제액이 과세가액 이상)이면
+    # 산출세액/할증/신고세액공제/최종세액이 모두 0원이므로 이후 계산 생략
+    if taxable_amount == 0:
+        return TaxResult(
+            total_inheritance=total_inheritance,
+            taxable_inheritance=taxable_inheritance,
+            total_deduction=total_deduction,
+            taxable_amount=0,
+            calculated_tax=0,
+            generation_surcharge=0,
+            filing_credit=0,
+            prior_gift_tax_credit=info.prior_gift.total_tax_paid,
+            final_tax=0,
+            deduction_detail=deduction_detail,
+        )
+
     # 5. 산출세액
     calculated_tax = calculate_tax_amount(taxable_amount)
 
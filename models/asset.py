@@ -1,8 +1,14 @@
 """상속 관련 데이터 모델"""
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional
 from enum import Enum
 
+# 금액 합계 속성(cached_property)은 처음 조회 시 인스턴스에 저장됨
+# → 합계가 의존하는 모델(Asset, Deductions, PriorGift, InheritanceInfo)은 frozen으로 필드 변경을 막음
+#   (값이 바뀌면 새로 생성, 예: dataclasses.replace)
+# 모델에는 __slots__를 두지 않음: 모든 필드에 기본값이 있고, cached_property가 인스턴스 __dict__에 저장하므로
+
 
 class HeirType(Enum):
     """상속인 유형"""
@@ -13,7 +19,7 @@ class HeirType(Enum):
     SIBLING = "형제자매"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Asset:
     """자산 정보"""
     real_estate: int = 0          # 부동산
@@ -25,14 +31,14 @@ class Asset:
     trust: int = 0                # 신탁재산
     other: int = 0                # 기타 자산
 
-    @property
+    @cached_property
     def total(self) -> int:
         """총 자산"""
         return (self.real_estate + self.financial + self.securities +
                 self.cash + self.insurance + self.retirement +
                 self.trust + self.other)
 
-    @property
+    @cached_property
     def net_financial(self) -> int:
         """순 금융재산 (금융재산공제 계산용) - 현금 제외, 보험금 포함"""
         return self.financial + self.securities + self.insurance
@@ -123,8 +129,18 @@ class Heir:
         """세대생략 상속 여부"""
         return any(c.is_grandchild for c in self.children)
 
+    @property
+    def has_surcharged_grandchild(self) -> bool:
+        """부모(피상속인 자녀)가 생존한 손자녀 여부 (세대생략 할증 대상)"""
+        return any(c.is_grandchild and c.parent_alive for c in self.children)
 
-@dataclass
+    @property
+    def has_minor_grandchild(self) -> bool:
+        """미성년 손자녀 여부 (세대생략 할증률 판정용)"""
+        return any(c.is_grandchild and c.is_minor for c in self.children)
+
+
+@dataclass(frozen=True)
 class Deductions:
     """공제 관련 정보"""
     public_charges: int = 0       # 공과금 (승계된 조세/공공요금)
@@ -133,7 +149,7 @@ class Deductions:
     debt: int = 0                 # 채무
 
 
-@dataclass
+@dataclass(frozen=True)
 class PriorGift:
     """사전증여 정보"""
     to_heir_10yr: int = 0         # 상속인에게 10년 내 증여
@@ -143,12 +159,12 @@ class PriorGift:
     business_succession: int = 0  # 창업자금/가업승계 (기간 무관)
     business_succession_tax: int = 0
 
-    @property
+    @cached_property
     def total(self) -> int:
         """총 사전증여액"""
         return self.to_heir_10yr + self.to_others_5yr + self.business_succession
 
-    @property
+    @cached_property
     def total_tax_paid(self) -> int:
         """총 납부 증여세"""
         return self.to_heir_10yr_tax + self.to_others_5yr_tax + self.business_succession_tax
@@ -163,7 +179,7 @@ class CoResidenceInfo:
     heir_is_homeless: bool = False  # 상속인 무주택 여부
 
 
-@dataclass
+@dataclass(frozen=True)
 class InheritanceInfo:
     """상속 정보 전체"""
     asset: Asset = field(default_factory=Asset)
@@ -175,12 +191,12 @@ class InheritanceInfo:
     # 신고 관련
     file_on_time: bool = True     # 기한 내 신고 여부 (신고세액공제 3%)
 
-    @property
+    @cached_property
     def total_inheritance(self) -> int:
         """총 상속재산 (사전증여 포함)"""
         return self.asset.total + self.prior_gift.total
 
-    @property
+    @cached_property
     def total_debt_deduction(self) -> int:
         """채무/비용 공제 합계"""
         # 장례비용: 500만원 ~ 1000만원
@@ -192,7 +208,7 @@ class InheritanceInfo:
 
         return self.deductions.public_charges + funeral + memorial + debt
 
-    @property
+    @cached_property
     def net_inheritance(self) -> int:
         """과세가액 (채무/장례비 차감 후, 사전증여 포함)"""
         value = self.asset.total + self.prior_gift.total - self.total_debt_deduction
@@ -2,13 +2,19 @@
 import pytest
 import sys
 import os
+from dataclasses import fields
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models.asset import InheritanceInfo, Asset, Heir
-from calculator.inheritance_tax import calculate_tax_amount, calculate_inheritance_tax
-from calculator.deductions import calculate_deductions, DeductionType
-from calculator.cases import compare_cases
+from models.asset import InheritanceInfo, Asset, Heir, ChildInfo, SpouseInfo, PriorGift
+from calculator.inheritance_tax import calculate_tax_amount, calculate_inheritance_tax, TaxResult
+from calculator.deductions import (
+    calculate_deductions, calculate_asset_deductions, calculate_personal_deductions,
+    calculate_minor_deduction, calculate_elderly_deduction, calculate_disabled_deduction,
+    calculate_financial_deduction, calculate_itemized_deductions, get_optimal_base_deduction_type,
+    DeductionType, DeductionResult, PersonalDeductionAmounts,
+)
+from calculator.cases import compare_cases, CaseResult
 
 
 class TestTaxCalculation:
@@ -34,6 +40,10 @@ class TestTaxCalculation:
         """50억: 50% - 누진공제 4.6억 = 20.4억"""
         assert calculate_tax_amount(5_000_000_000) == 2_040_000_000
 
+    def test_tax_bracket_경계_초과(self):
+        """1억 1원: 다음 구간(20%) 적용"""
+        assert calculate_tax_amount(100_000_001) == int(100_000_001 * 0.20 - 10_000_000)
+
     def test_zero_taxable(self):
         """과세표준 0원"""
         assert calculate_tax_amount(0) == 0
@@ -65,6 +75,46 @@ class TestDeductions:
         deductions = calculate_deductions(info, DeductionType.LUMP_SUM, 100_000_000)
         assert deductions["배우자공제"] == 500_000_000
 
+    def test_precomputed_asset_deductions(self):
+        """미리 계산한 재산 관련 공제를 넘겨도 결과 동일"""
+        info = InheritanceInfo(asset=Asset(real_estate=1_000_000_000, financial=300_000_000))
+        asset_deductions = calculate_asset_deductions(info)
+        assert asset_deductions == {"금융재산공제": 60_000_000}
+        assert calculate_deductions(info, DeductionType.LUMP_SUM, 0, asset_deductions) == \
+            calculate_deductions(info, DeductionType.LUMP_SUM, 0)
+
+    def test_personal_deductions_single_pass(self):
+        """인적공제 일괄 집계가 개별 공제 함수 결과와 동일"""
+        info = InheritanceInfo(heir=Heir(
+            spouse=SpouseInfo(exists=True, is_disabled=True, life_expectancy=20),
+            children=[ChildInfo(age=10), ChildInfo(age=70, is_disabled=True, life_expectancy=12),
+                      ChildInfo(age=30)],
+            num_elderly_parents=1,
+        ))
+        personal = calculate_personal_deductions(info)
+        assert personal["미성년자공제"] == calculate_minor_deduction(info) == 90_000_000
+        assert personal["연로자공제"] == calculate_elderly_deduction(info) == 100_000_000
+        assert personal["장애인공제"] == calculate_disabled_deduction(info) == 320_000_000
+
+    def test_optimal_type_without_itemized_dict(self):
+        """항목 딕셔너리 없이 합계로 판정해도 딕셔너리 합계 판정과 동일"""
+        for ages in ([30], [30, 35], [1, 3], [10, 70, 80]):
+            info = InheritanceInfo(heir=Heir(children=[ChildInfo(age=age) for age in ages]))
+            itemized = calculate_itemized_deductions(info)
+            assert get_optimal_base_deduction_type(info) == get_optimal_base_deduction_type(info, itemized)
+        assert get_optimal_base_deduction_type(info) == DeductionType.ITEMIZED
+
+    def test_financial_deduction_boundaries(self):
+        """금융재산공제 구간 경계: 2천만원 미만 전액, 1억 이하 2천만원, 초과 20% (최대 2억)"""
+        def ded(amount):
+            return calculate_financial_deduction(InheritanceInfo(asset=Asset(financial=amount)))
+        assert ded(19_999_999) == 19_999_999
+        assert ded(20_000_000) == 20_000_000
+        assert ded(100_000_000) == 20_000_000
+        assert ded(100_000_005) == 20_000_001
+        assert ded(1_000_000_000) == 200_000_000
+        assert ded(2_000_000_000) == 200_000_000
+
 
 class TestCaseComparison:
     """케이스 비교 테스트"""
@@ -95,6 +145,19 @@ class TestCaseComparison:
         assert len(result.cases) >= 1
         assert result.optimal_case is not None
 
+    def test_sorted_cases(self):
+        """정렬 목록은 세액 오름차순이고 첫 케이스가 최적 케이스"""
+        info = InheritanceInfo(
+            asset=Asset(real_estate=2_000_000_000),
+            heir=Heir(spouse=SpouseInfo(exists=True), children=[ChildInfo(), ChildInfo()])
+        )
+        result = compare_cases(info)
+
+        taxes = [c.final_tax for c in result.sorted_cases]
+        assert taxes == sorted(taxes)
+        assert result.sorted_cases[0] is result.optimal_case
+        assert result.get_sorted_cases() == result.sorted_cases
+
 
 class TestEndToEnd:
     """통합 테스트"""
@@ -120,6 +183,30 @@ class TestEndToEnd:
         # 총 상속재산 확인
         assert result.optimal_case.tax_result.total_inheritance == 1_500_000_000
 
+    def test_zero_taxable_amount(self):
+        """공제액이 과세가액 이상이면 모든 케이스 세액 0원 (기납부 증여세는 그대로 표시)"""
+        info = InheritanceInfo(
+            asset=Asset(real_estate=50_000_000),
+            prior_gift=PriorGift(to_heir_10yr=100_000_000, to_heir_10yr_tax=10_000_000)
+        )
+        result = compare_cases(info)
+
+        for case in result.cases:
+            tax_result = case.tax_result
+            assert tax_result.taxable_amount == 0
+            assert tax_result.calculated_tax == 0
+            assert tax_result.final_tax == 0
+            assert tax_result.prior_gift_tax_credit == 10_000_000
+
+
+class TestResultSlots:
+    """결과 클래스 __slots__ 테스트"""
+
+    def test_slots_match_fields(self):
+        """직접 선언한 __slots__가 데이터클래스 필드와 일치"""
+        for cls in (CaseResult, TaxResult, DeductionResult, PersonalDeductionAmounts):
+            assert set(cls.__slots__) == {f.name for f in fields(cls)}, cls.__name__
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,152 @@
+"""자연어 파싱 (정규식 fallback) 테스트"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streamlit as st
+
+import app
+from app import parse_assets, parse_debts, birth_year_to_age, format_currency, LOCAL_FAST_PATHS
+
+
+class TestParseAssets:
+    """자산 파싱 테스트"""
+
+    def test_multiple_categories(self):
+        """여러 카테고리 동시 입력"""
+        assets = parse_assets("부동산 10억, 현금 5천만원, 금융자산 3억")
+        assert assets["real_estate"] == 1_000_000_000
+        assert assets["cash"] == 50_000_000
+        assert assets["financial"] == 300_000_000
+
+    def test_longest_keyword_no_double_count(self):
+        """'보험금'이 '보험'으로 중복 집계되지 않음"""
+        assets = parse_assets("아파트 15억 짜리 하나, 사망보험금 2억")
+        assert assets["real_estate"] == 1_500_000_000
+        assert assets["insurance"] == 200_000_000
+
+    def test_quantity_not_amount(self):
+        """'2채' 같은 수량은 금액으로 인식하지 않음"""
+        assets = parse_assets("아파트 2채 20억")
+        assert assets["real_estate"] == 2_000_000_000
+
+    def test_amount_belongs_to_nearest_keyword(self):
+        """금액 없는 키워드가 다음 키워드의 금액을 가져가지 않음"""
+        assets = parse_assets("아파트 하나랑 현금 5천만원")
+        assert assets["real_estate"] == 0
+        assert assets["cash"] == 50_000_000
+
+    def test_next_keyword_not_swallowed(self):
+        """'원'/수량 단위가 다음 키워드('원룸', '채권')의 일부를 먹지 않음"""
+        assets = parse_assets("사무실 1.5억원룸 3억")
+        assert assets["real_estate"] == 450_000_000
+        assets = parse_assets("기타 0채권 3억")
+        assert assets["securities"] == 300_000_000
+        assert assets["other"] == 0
+
+
+class TestParseDebts:
+    """채무/비용 파싱 테스트"""
+
+    def test_multiple_categories(self):
+        """여러 카테고리 동시 입력"""
+        debts = parse_debts("대출 2억, 장례비 1500만원, 묘지 500만원, 세금 300만")
+        assert debts["debt"] == 200_000_000
+        assert debts["funeral_expense"] == 15_000_000
+        assert debts["funeral_memorial"] == 5_000_000
+        assert debts["public_charges"] == 3_000_000
+
+    def test_longest_keyword_no_double_count(self):
+        """'담보대출'이 '대출'로 중복 집계되지 않음"""
+        debts = parse_debts("담보대출 3억")
+        assert debts["debt"] == 300_000_000
+
+
+class TestLocalFastPath:
+    """단답형 로컬 파싱 테스트 (LLM 호출 생략)"""
+
+    def test_short_yes_no(self):
+        """정확한 단답은 로컬 판정"""
+        assert LOCAL_FAST_PATHS["yes_no"]("네.") == {"answer": True}
+        assert LOCAL_FAST_PATHS["yes_no"]("아니요, 없어요") == {"answer": False}
+        assert LOCAL_FAST_PATHS["grandchild"]("아뇨") == {"has_grandchild": False}
+
+    def test_ambiguous_yes_no_falls_through(self):
+        """단답이 아니면 None (LLM으로 넘김)"""
+        assert LOCAL_FAST_PATHS["yes_no"]("살아계셔") is None
+        assert LOCAL_FAST_PATHS["yes_no"]("네 그런데 이혼했어요") is None
+
+    def test_children_count(self):
+        """"N명" / "없어요"는 로컬 판정, 그 외는 None"""
+        assert LOCAL_FAST_PATHS["children_count"]("2명") == {"has_children": True, "num_children": 2}
+        assert LOCAL_FAST_PATHS["children_count"]("없어요") == {"has_children": False, "num_children": 0}
+        assert LOCAL_FAST_PATHS["children_count"]("아들 하나 딸 하나") is None
+        assert LOCAL_FAST_PATHS["children_count"]("2명, 35세 32세") is None
+
+    def test_none_or_amount_only(self):
+        """금액 단계: "없어요"/금액만 입력은 로컬 판정, 키워드가 섞이면 None"""
+        assert LOCAL_FAST_PATHS["funeral_costs"]("없어요") == {
+            "has_costs": False, "funeral_expense": 0, "funeral_memorial": 0
+        }
+        assert LOCAL_FAST_PATHS["prior_gift"]("3억") == {"has_gift": True, "amount": 300_000_000, "tax": 0}
+        assert LOCAL_FAST_PATHS["other_debts"]("5천만원") == {
+            "has_debts": True, "public_charges": 0, "debt": 50_000_000
+        }
+        assert LOCAL_FAST_PATHS["real_estate_debt"]("전세 2억") is None
+
+
+class TestBirthYearToAge:
+    """출생년도 → 나이 환산 테스트"""
+
+    def test_birth_year_converted(self):
+        """1900~기준 연도 범위는 출생년도로 보고 나이로 변환"""
+        assert birth_year_to_age(1960) == 65
+        assert birth_year_to_age(2025) == 0
+
+    def test_age_kept(self):
+        """나이로 보이는 값은 그대로"""
+        assert birth_year_to_age(65) == 65
+        assert birth_year_to_age(0) == 0
+
+
+class TestFormatCurrency:
+    """금액 표시 테스트"""
+
+    def test_float_same_as_int(self):
+        """float 금액도 정수와 같은 형식으로 표시"""
+        assert format_currency(1_500_000_000.0) == format_currency(1_500_000_000) == "15억원"
+        assert format_currency(12_345.6) == "1만원"
+
+
+class TestChildrenStep:
+    """자녀 단계 테스트 (자녀 수 + 나이 일괄 파싱)"""
+
+    def run_children_step(self, monkeypatch, ages):
+        """LLM이 자녀 2명, 나이 ages로 응답했을 때 다음 단계 반환"""
+        monkeypatch.setattr(app, "get_gemini_client", lambda: object())
+        monkeypatch.setattr(app, "parse_with_llm_multi", lambda user_input, parse_types: {
+            "children_count": {"has_children": True, "num_children": 2},
+            "children": {"ages": ages, "has_disabled": False},
+        })
+        st.session_state.step = app.STEP_INDEX["children"]
+        st.session_state.data = {}
+        st.session_state.messages = []
+        st.session_state.step_history = []
+        app.process_input("아들 하나 딸 하나")
+        return st.session_state.step
+
+    def test_missing_ages_ask_detail(self, monkeypatch):
+        """나이가 언급되지 않아 0으로 채워진 응답이면 나이 질문 단계로"""
+        assert self.run_children_step(monkeypatch, [0, 0]) == app.STEP_INDEX["children_detail"]
+        assert "children_ages" not in st.session_state.data
+
+    def test_all_ages_skip_detail(self, monkeypatch):
+        """전원의 나이가 있으면 나이 질문 생략"""
+        assert self.run_children_step(monkeypatch, [35, 1990]) == app.STEP_INDEX["grandchild"]
+        assert st.session_state.data["children_ages"] == [35, 35]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])